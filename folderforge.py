@@ -1,15 +1,89 @@
 #!/usr/bin/env python3
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
+import itertools
 import os
 from pathlib import Path
 import re
-from typing import Iterable, List, Optional
+import stat
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple
 
 # =========================
 # Export mode
 # =========================
-def load_ignore_patterns(ignore: Iterable[str], ignore_file: Optional[Path]) -> List[str]:
+class IgnoreMatcher(NamedTuple):
+    literal_names: FrozenSet[str]
+    literal_rels: FrozenSet[str]
+    name_prefixes: Tuple[str, ...]
+    name_suffixes: Tuple[str, ...]
+    rel_prefixes: Tuple[str, ...]
+    rel_suffixes: Tuple[str, ...]
+    name_re: Optional[Pattern[str]]
+    rel_re: Optional[Pattern[str]]
+    uses_rel: bool
+
+GLOB_CHARS = "*?["
+# fnmatch.fnmatch() normcases its arguments, so ignore patterns have always been
+# case-insensitive on Windows; the matcher keeps that by lowercasing there.
+CASE_INSENSITIVE = os.path.normcase("A") != "A"
+
+def _has_glob(pattern: str) -> bool:
+    return any(c in pattern for c in GLOB_CHARS)
+
+# Process-wide cache of translated globs, shared by every pattern set that
+# contains the same pattern (e.g. repeated library calls with varying lists).
+_PATTERN_CACHE: Dict[str, str] = {}
+
+def _translate(pattern: str) -> str:
+    translated = _PATTERN_CACHE.get(pattern)
+    if translated is None:
+        translated = _PATTERN_CACHE[pattern] = fnmatch.translate(pattern)
+    return translated
+
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    # One alternation of translated globs: a single regex match per candidate
+    # instead of an fnmatch call per pattern.
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{_translate(p)})" for p in patterns))
+
+def compile_ignore_patterns(patterns: List[str]) -> IgnoreMatcher:
+    # Glob-free patterns become set lookups and "*suffix"/"prefix*" globs are
+    # answered with str.endswith/startswith; only the remaining patterns go
+    # through the regex engine. Patterns without a "/" only ever match the
+    # folder name, so the relative path is needed only when one has a "/".
+    literal_names, literal_rels = set(), set()
+    name_prefixes, name_suffixes, rel_prefixes, rel_suffixes = [], [], [], []
+    complex_patterns, complex_rels = [], []
+    if CASE_INSENSITIVE:
+        patterns = [p.lower() for p in patterns]
+    for p in patterns:
+        has_slash = "/" in p
+        rel = p.rstrip("/")
+        if not _has_glob(p):
+            (literal_rels if has_slash else literal_names).add(rel)
+        elif p.startswith("*") and not _has_glob(p[1:]):
+            (rel_suffixes if has_slash else name_suffixes).append(rel[1:])
+        elif p.endswith("*") and not _has_glob(p[:-1]):
+            (rel_prefixes if has_slash else name_prefixes).append(rel[:-1])
+        else:
+            complex_patterns.append(p)
+            if has_slash:
+                complex_rels.append(rel)
+    return IgnoreMatcher(
+        literal_names=frozenset(literal_names),
+        literal_rels=frozenset(literal_rels),
+        name_prefixes=tuple(name_prefixes),
+        name_suffixes=tuple(name_suffixes),
+        rel_prefixes=tuple(rel_prefixes),
+        rel_suffixes=tuple(rel_suffixes),
+        name_re=_compile_globs(tuple(complex_patterns)),
+        rel_re=_compile_globs(tuple(complex_rels)),
+        uses_rel=bool(literal_rels or rel_prefixes or rel_suffixes or complex_rels),
+    )
+
+def load_ignore_patterns(ignore: Iterable[str], ignore_file: Optional[Path]) -> IgnoreMatcher:
     patterns = list(ignore) if ignore else []
     if ignore_file:
         for line in ignore_file.read_text(encoding="utf-8").splitlines():
@@ -17,132 +91,385 @@ def load_ignore_patterns(ignore: Iterable[str], ignore_file: Optional[Path]) ->
             if not line or line.startswith("#"):
                 continue
             patterns.append(line)
-    return patterns
+    return compile_ignore_patterns(patterns)
 
-def should_ignore_dir(dir_path: Path, root: Path, patterns: List[str]) -> bool:
-    if not patterns:
+def should_ignore_dir(name: str, rel_posix: str, matcher: IgnoreMatcher) -> bool:
+    if CASE_INSENSITIVE:
+        name = name.lower()
+        rel_posix = rel_posix.lower()
+    if (
+        name in matcher.literal_names
+        or name.startswith(matcher.name_prefixes)
+        or name.endswith(matcher.name_suffixes)
+        or (matcher.name_re is not None and matcher.name_re.match(name))
+    ):
+        return True
+    if not matcher.uses_rel:
         return False
-    rel = dir_path.relative_to(root).as_posix()
-    name = dir_path.name
-    return any(
-        fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel, p.rstrip("/"))
-        for p in patterns
+    return bool(
+        rel_posix in matcher.literal_rels
+        or rel_posix.startswith(matcher.rel_prefixes)
+        or rel_posix.endswith(matcher.rel_suffixes)
+        or (matcher.rel_re is not None and matcher.rel_re.match(rel_posix))
     )
 
-def write_tree(root: Path, output_file: Path, ignore_patterns: List[str], verbose: bool, max_depth: Optional[int]) -> None:
-    def _tree(dir_path: Path, prefix: str = "", current_depth: int = 0) -> list[str]:
-        if max_depth is not None and current_depth > max_depth:
-            return []
-        
-        if verbose:
-            print(f"[SCAN] {dir_path}")
-        
-        entries = sorted(
-            (e for e in dir_path.iterdir() if not (e.is_dir() and should_ignore_dir(e, root, ignore_patterns))),
-            key=lambda e: (not e.is_dir(), e.name.lower()),
-        )
+CONN_MID = "├─ ".encode()
+CONN_LAST = "└─ ".encode()
+EXT_MID = "│  ".encode()
+EXT_LAST = b"   "
+NL = b"\n"
+# surrogateescape writes names that are not valid UTF-8 back as their raw bytes
+NAME_ENCODING = ("utf-8", "surrogateescape")
+TMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+IN_PLACE_FLAGS = os.O_CREAT | os.O_TRUNC | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+def _open_output(target: str) -> Tuple[int, Optional[str], Optional[str]]:
+    # Returns (fd, tmp_path, skip_path). Normally fd is a fresh temporary file
+    # next to target, carrying over an existing target's mode and owner, so
+    # an interrupted export leaves the previous file intact. When that is not
+    # possible (folder not writable, owner cannot be kept) target is truncated
+    # and written in place as write_text() did, and tmp_path is None.
+    # skip_path is the file the walk must not list: the temporary file, or a
+    # target that did not exist before this export.
+    # 0o666 lets the umask decide the mode of new files.
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+    tmp_path = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, TMP_FLAGS, 0o666)
+    except OSError:
+        return os.open(target, IN_PLACE_FLAGS, 0o666), None, target if st is None else None
+    if st is not None:
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            tmp_st = os.stat(tmp_path)
+            if (tmp_st.st_uid, tmp_st.st_gid) != (st.st_uid, st.st_gid):
+                os.chown(tmp_path, st.st_uid, st.st_gid)
+        except OSError:
+            os.close(fd)
+            os.unlink(tmp_path)
+            return os.open(target, IN_PLACE_FLAGS, 0o666), None, None
+    return fd, tmp_path, tmp_path
+
+def write_tree(root: Path, output_file: Path, ignore_patterns: IgnoreMatcher, verbose: bool, max_depth: Optional[int], jobs: int = 1) -> None:
+    root_path = str(root)
+    # Resolved once so the walk tests a local instead of re-reading the flag
+    # and looking up the print builtin for every directory.
+    log = print if verbose else None
+    uses_rel = ignore_patterns.uses_rel
+
+    def _scan(dir_path: str, rel_prefix: str) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str]]]:
+        if log:
+            log(f"[SCAN] {dir_path}")
         
-        lines = []
-        for i, entry in enumerate(entries):
-            if entry.is_dir() and should_ignore_dir(entry, root, ignore_patterns):
-                if verbose:
-                    print(f"[SKIP] Ignored folder: {entry}")
-                continue
-            
-            connector = "└─ " if i == len(entries) - 1 else "├─ "
-            line = prefix + connector + entry.name + ("/" if entry.is_dir() else "")
-            lines.append(line)
-            
-            if entry.is_dir():
-                extension = "│  " if i < len(entries) - 1 else "   "
-                lines.extend(_tree(entry, prefix + extension, current_depth + 1))
+        # Like os.walk(), an unreadable folder is listed without children
+        # rather than aborting an export that is already half written.
+        try:
+            it = os.scandir(dir_path)
+        except OSError as e:
+            if log:
+                log(f"[WARN] Cannot read folder: {e}")
+            return [], []
         
-        return lines
+        # DirEntry.is_dir() answers from the d_type returned by the directory
+        # read itself, so no extra stat() is issued per entry. Ignored folders
+        # are pruned here, before they are ever sorted or descended into.
+        dirs, files = [], []
+        add_dir, add_file = dirs.append, files.append
+        # Errors while reading are handled as os.walk() does too: an entry
+        # whose type cannot be determined is listed as a file, and a failed
+        # read keeps whatever entries were already returned.
+        with it:
+            try:
+                for e in it:
+                    name = e.name
+                    try:
+                        is_dir = e.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        if name != skip_name or dir_path != skip_dir:
+                            add_file((name.lower(), name))
+                    elif should_ignore_dir(name, rel_prefix + name if uses_rel else name, ignore_patterns):
+                        if log:
+                            log(f"[SKIP] Ignored folder: {e.path}")
+                    else:
+                        add_dir((name.lower(), name, e.path))
+            except OSError as e:
+                if log:
+                    log(f"[WARN] Error while reading folder {dir_path}: {e}")
+        # Sort keys are extracted once per entry, so the sort only compares
+        # plain tuples. Names are unique within a directory, which makes the
+        # name a deterministic tie-break for case-only differences.
+        dirs.sort()
+        files.sort()
+        return dirs, files
+
+    def _children(dir_path: str, rel_prefix: str, prefix: bytes, depth: int) -> List[Tuple[bytes, Optional[str], str, bytes, int]]:
+        # Stack items for one folder's children, in push order: the files
+        # chunk first, then the folders from last to first, so that pop()
+        # hands them back in sorted order.
+        dirs, files = _scan(dir_path, rel_prefix)
+        items = []
+        add = items.append
+        if files:
+            mid = NL + prefix + CONN_MID
+            add((b"".join([mid + name.encode(*NAME_ENCODING) for _, name in files[:-1]])
+                 + NL + prefix + CONN_LAST + files[-1][1].encode(*NAME_ENCODING), None, "", b"", 0))
+        for i in range(len(dirs) - 1, -1, -1):
+            _, name, path = dirs[i]
+            is_last = not files and i == len(dirs) - 1
+            add((
+                NL + prefix + (CONN_LAST if is_last else CONN_MID) + name.encode(*NAME_ENCODING) + b"/",
+                path,
+                # The relative path is only built up when a pattern needs it.
+                rel_prefix + name + "/" if uses_rel else "",
+                prefix + (EXT_LAST if is_last else EXT_MID),
+                depth + 1,
+            ))
+        return items
 
-    if verbose:
-        print(f"[EXPORT] Starting from root: {root}")
+    def _tree(item: Tuple[bytes, Optional[str], str, bytes, int]) -> Iterator[bytes]:
+        # Explicit DFS stack of (chunk, path, rel_prefix, prefix, depth). chunk
+        # is already-rendered output, each line preceded by its "\n". For a
+        # folder, path/rel_prefix/prefix/depth describe how to expand it; a
+        # directory's files are leaves and are pushed as one pre-joined chunk
+        # with path None, so the loop runs once per folder rather than once
+        # per entry. Only this stack is resident; chunks are yielded lazily.
+        stack = [item]
+        extend, pop = stack.extend, stack.pop
+        while stack:
+            chunk, path, rel_prefix, prefix, depth = pop()
+            yield chunk
+            if path is not None and (max_depth is None or depth <= max_depth):
+                extend(_children(path, rel_prefix, prefix, depth))
+
+    def _render(item: Tuple[bytes, Optional[str], str, bytes, int]) -> bytearray:
+        # A worker's subtree has to be held until its turn to be written, so
+        # it is grown in place rather than kept as chunks and joined.
+        buf = bytearray()
+        for chunk in _tree(item):
+            buf += chunk
+        return buf
+
+    if log:
+        log(f"[EXPORT] Starting from root: {root}")
     
-    lines = [root.name + "/"] if max_depth is None or max_depth >= 0 else []
-    if max_depth is None or max_depth > 0:
-        lines.extend(_tree(root, current_depth=0))
+    # Output goes to a temporary file that replaces the target only once the
+    # walk has finished; see _open_output() for when it is written in place.
+    target = os.path.realpath(output_file)
+    fd, tmp_path, skip_path = _open_output(target)
+    # The file being written must not list itself when it lands inside root.
+    skip_dir = skip_name = None
+    if skip_path is not None:
+        try:
+            skip_rel = os.path.relpath(os.path.dirname(skip_path), os.path.realpath(root_path))
+        except ValueError:
+            # Different drives on Windows
+            skip_rel = os.pardir
+        if skip_rel == os.curdir:
+            skip_dir = root_path
+        elif skip_rel != os.pardir and not skip_rel.startswith(os.pardir + os.sep):
+            skip_dir = os.path.join(root_path, skip_rel)
+        skip_name = os.path.basename(skip_path)
     
-    output_file.write_text("\n".join(lines), encoding="utf-8")
-    if verbose:
-        print(f"[DONE] Structure exported to: {output_file}")
+    try:
+        # Lines are built as UTF-8 bytes from pre-encoded connectors and
+        # streamed through a large binary write buffer, with no text encoder
+        # in between.
+        with open(fd, "wb", buffering=1 << 17) as fh:
+            if max_depth is None or max_depth >= 0:
+                fh.write(root.name.encode(*NAME_ENCODING) + b"/")
+            if max_depth is None or max_depth > 0:
+                # Every entry follows the root line, so the separator goes
+                # first and the file keeps its historical lack of a trailing
+                # newline.
+                if jobs == 1:
+                    fh.writelines(_tree((b"", root_path, "", b"", 0)))
+                else:
+                    # Scanning is I/O bound and releases the GIL, so top-level
+                    # folders are walked on worker threads. Each renders its
+                    # own subtree and map() returns them in sorted order.
+                    top = _children(root_path, "", b"", 0)[::-1]
+                    workers = jobs or min(32, (os.cpu_count() or 1) * 4)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        fh.writelines(executor.map(_render, top))
+        if tmp_path is not None:
+            os.replace(tmp_path, target)
+    except BaseException:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        raise
+    
+    if log:
+        log(f"[DONE] Structure exported to: {output_file}")
 
 # =========================
 # Create mode
 # =========================
+INDENT_UNITS = ("│  ", "   ")
+CONNECTORS = ("├─ ", "└─ ")
+TOUCH_FLAGS = os.O_CREAT | os.O_WRONLY | getattr(os, "O_CLOEXEC", 0)
+
+def _parse_line_lenient(line: str) -> Optional[Tuple[int, str, bool]]:
+    # Fallback for trees not in the exporter's exact layout, e.g. tree(1)
+    # output with "├── " connectors and four-wide indents, or hand-edited
+    # files with odd spacing. The name follows the first run of "─"; the
+    # indent before the connector is counted in units of the connector's
+    # width, with a "│" and its trailing spaces always forming one unit.
+    if not line.startswith((" ", "\t", "│", "├", "└")):
+        # No connector and no indent, e.g. the root line
+        return 0, line.strip().rstrip("/"), line.endswith("/")
+    start = line.find("─")
+    if start == -1:
+        return None
+    end = start
+    while end < len(line) and line[end] == "─":
+        end += 1
+    name = line[end:].strip().rstrip("/")
+    if not name:
+        return None
+    prefix = line[:start]
+    if prefix.endswith(("├", "└")):
+        prefix = prefix[:-1]
+    width = 4 if end - start > 1 else 3
+    depth = j = 0
+    while j < len(prefix):
+        unit_end = j + width
+        if prefix[j] == "│":
+            j += 1
+        while j < unit_end and j < len(prefix) and prefix[j] == " ":
+            j += 1
+        if j < unit_end and j < len(prefix) and prefix[j] != "│":
+            # Neither indent nor bar; not a line this parser understands
+            return None
+        depth += 1
+    return depth, name, line.endswith("/")
+
+def parse_line(line: str) -> Optional[Tuple[int, str, bool]]:
+    # Single left-to-right scan: count the three-character indent units, step
+    # over the connector, and the rest of the line is the entry name. Anything
+    # else goes through the lenient parser; None means the line is unusable.
+    i = depth = 0
+    while line.startswith(INDENT_UNITS, i):
+        i += 3
+        depth += 1
+    if not line.startswith(CONNECTORS, i):
+        return _parse_line_lenient(line)
+    name = line[i + 3:].strip().rstrip("/")
+    if not name:
+        return None
+    return depth, name, line.endswith("/")
+
 def create_structure_from_file(file_path: Path, dest_root: Path, strip_root: bool, verbose: bool) -> None:
     lines = file_path.read_text(encoding="utf-8").splitlines()
-    base_dir = dest_root
-    dirs_stack: List[Path] = []
+    log = print if verbose else None
     
-    if verbose:
-        print(f"[CREATE] Starting from root: {dest_root}")
+    if log:
+        log(f"[CREATE] Starting from root: {dest_root}")
 
-    for i, raw_line in enumerate(lines):
-        line = raw_line.rstrip()
+    # Parsing is done up front into a flat (depth, name, is_dir) array; the
+    # filesystem is only touched once all paths are known.
+    entries: List[Tuple[int, str, bool]] = []
+    root_candidate = False
+    for i, line in enumerate(map(str.rstrip, lines)):
         if not line:
             continue
-            
-        is_dir = line.endswith('/')
-        line = line.rstrip('/')
-        
-        # Determine depth based on leading characters
-        # This is more robust to different spacing from export
-        depth = 0
-        if "─" in line:
-            parts = line.split("─", 1)
-            prefix = parts[0]
-            name = parts[1].strip()
-            # Each '│' or ' ' followed by two spaces contributes to the depth
-            depth = prefix.count("│") + prefix.count("  ") // 2
-        else:
-            name = line
-            
-        if i == 0 and not strip_root and is_dir:
-            base_dir = dest_root / name
-            base_dir.mkdir(parents=True, exist_ok=True)
-            if verbose:
-                print(f"[CREATE] Root directory: {base_dir}")
-            dirs_stack.append(base_dir)
+        entry = parse_line(line)
+        if entry is None:
+            if log:
+                log(f"[WARN] Unrecognized line, skipping: {line}")
             continue
-        
-        # Adjust the directory stack based on depth
-        if depth > len(dirs_stack):
+        if i == 0:
+            root_candidate = entry[2]
+        entries.append(entry)
+    # Paths are plain strings from here on; pathlib stays at the CLI edge.
+    dest = base_dir = os.fspath(dest_root)
+    # Everything is collected first so that directories can be created in one
+    # sorted batch; dest_root is included for files placed directly in it.
+    dirs_to_make: List[str] = [base_dir]
+    files_to_touch: List[str] = []
+    # ancestors[d] is the last directory seen at depth d. Only the first
+    # `level` slots are valid parents for the next entry, so moving back up
+    # the tree is just a smaller level, never a pop loop.
+    ancestors = [""] * (max((depth for depth, _, _ in entries), default=0) + 1)
+    level = 0
+
+    start = 0
+    if not strip_root and root_candidate:
+        base_dir = os.path.join(base_dir, entries[0][1])
+        dirs_to_make.append(base_dir)
+        if log:
+            log(f"[CREATE] Root directory: {base_dir}")
+        ancestors[0] = base_dir
+        level = 1
+        start = 1
+
+    for depth, name, is_dir in itertools.islice(entries, start, None):
+        if depth > level:
             # This handles cases where the structure is invalid
-            if verbose:
-                print(f"[WARN] Invalid depth, skipping line: {raw_line}")
+            if log:
+                log(f"[WARN] Invalid depth, skipping entry: {name}")
             continue
-        elif depth < len(dirs_stack):
-            dirs_stack = dirs_stack[:depth]
 
-        # Use the correct parent directory
-        parent = base_dir if depth == 0 or not dirs_stack else dirs_stack[-1]
-        target = parent / name
-        
+        target = (ancestors[depth - 1] if depth else base_dir) + os.sep + name
         if is_dir:
-            target.mkdir(parents=True, exist_ok=True)
-            if verbose:
-                print(f"[DIR] {target}")
-            # Ensure the stack is at the correct depth before appending
-            while len(dirs_stack) > depth:
-                dirs_stack.pop()
-            dirs_stack.append(target)
+            dirs_to_make.append(target)
+            ancestors[depth] = target
+            level = depth + 1
         else:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            with open(target, "a", encoding="utf-8"):
-                pass
-            if verbose:
-                print(f"[FILE] {target}")
+            files_to_touch.append(target)
+            # A name like "docs/readme.md" needs folders no line declared
+            if "/" in name or os.sep in name:
+                dirs_to_make.append(os.path.dirname(target))
+            level = depth
 
-    if verbose:
-        print(f"[DONE] Folder structure created in: {dest_root.resolve()}")
+    # A parent always sorts before its children, so once it is known to exist
+    # each directory needs a single mkdir() instead of a makedirs() walk.
+    existing = set()
+    # The destination and root folder were already announced with [CREATE]
+    announced = {dest, base_dir}
+    for d in sorted(set(dirs_to_make)):
+        if os.path.dirname(d) in existing:
+            try:
+                os.mkdir(d)
+            except FileExistsError:
+                if not os.path.isdir(d):
+                    raise
+        else:
+            os.makedirs(d, exist_ok=True)
+        existing.add(d)
+        if log and d not in announced:
+            log(f"[DIR] {d}")
+
+    # Touch files with a bare descriptor rather than a buffered text wrapper.
+    # No O_TRUNC, so existing files keep their contents as with mode "a", and
+    # 0o666 leaves the final permissions to the umask as open() did.
+    for f in files_to_touch:
+        os.close(os.open(f, TOUCH_FLAGS, 0o666))
+        if log:
+            log(f"[FILE] {f}")
+
+    if log:
+        log(f"[DONE] Folder structure created in: {dest_root.resolve()}")
 
 # =========================
 # CLI
 # =========================
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Export or create folder structures.")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -154,6 +481,7 @@ def main():
     export_parser.add_argument("--ignore-file", type=Path, help="File with glob patterns to ignore.")
     export_parser.add_argument("--verbose", action="store_true", help="Show detailed actions.")
     export_parser.add_argument("--depth", type=int, default=None, help="Maximum depth of the directory tree to export (0 for root only, None for unlimited).")
+    export_parser.add_argument("--jobs", type=_non_negative_int, default=1, help="Number of threads used to scan top-level folders in parallel (0 for automatic).")
 
     create_parser = subparsers.add_parser("create", help="Create folder structure from a text file.")
     create_parser.add_argument("file", type=Path, help="Path to the text file containing the folder structure.")
@@ -170,7 +498,7 @@ def main():
             print(f"Error: {root_dir} is not a valid directory")
             return
         patterns = load_ignore_patterns(args.ignore, args.ignore_file)
-        write_tree(root_dir, out_file, patterns, args.verbose, args.depth)
+        write_tree(root_dir, out_file, patterns, args.verbose, args.depth, args.jobs)
 
     elif args.command == "create":
         file_path = args.file.resolve()